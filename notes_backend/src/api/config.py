@@ -29,19 +29,41 @@ class Settings:
 
         # CORS configuration (comma-separated origins). Use "*" to allow all.
         self.cors_allow_origins_raw: str = cors_allow_origins or os.getenv("CORS_ALLOW_ORIGINS", "*")
+        self._cors_allow_origins: List[str] = self._parse_cors_allow_origins(self.cors_allow_origins_raw)
 
         # Database configuration: SQLite file path. Use ':memory:' for ephemeral DB.
         # Default to a file 'notes.db' in the current working directory.
         self.notes_db_path: str = notes_db_path or os.getenv("NOTES_DB_PATH", "notes.db")
 
-    # PUBLIC_INTERFACE
-    def cors_allow_origins(self) -> List[str]:
-        """Return the CORS origins as a list, handling '*' as a wildcard."""
-        raw = (self.cors_allow_origins_raw or "").strip()
+    @staticmethod
+    def _parse_cors_allow_origins(raw: str) -> List[str]:
+        """Parse a comma-separated origins string into a list, handling '*' as a wildcard."""
+        raw = (raw or "").strip()
         if raw == "" or raw == "*":
             return ["*"]
-        # Split by comma, trim whitespace, drop empty values
-        return [o.strip() for o in raw.split(",") if o.strip()]
+        # Single pass over the string: trim whitespace around each comma-separated
+        # value and drop empty ones, slicing each origin out exactly once.
+        origins: List[str] = []
+        length = len(raw)
+        start = 0
+        while start < length:
+            end = raw.find(",", start)
+            if end == -1:
+                end = length
+            while start < end and raw[start].isspace():
+                start += 1
+            stop = end
+            while stop > start and raw[stop - 1].isspace():
+                stop -= 1
+            if stop > start:
+                origins.append(raw[start:stop])
+            start = end + 1
+        return origins
+
+    # PUBLIC_INTERFACE
+    def cors_allow_origins(self) -> List[str]:
+        """Return the CORS origins as a list, handling '*' as a wildcard (parsed once at init)."""
+        return self._cors_allow_origins
 
     def __repr__(self) -> str:  # For debugging purposes
         return (
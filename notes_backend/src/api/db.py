@@ -1,46 +1,340 @@
+import os
+import queue
 import sqlite3
-from typing import Iterable, Optional
+import threading
+from contextlib import contextmanager
+from typing import ContextManager, Dict, Iterable, Iterator, Optional, Tuple
 
+import anyio
 
-def _configure_connection(conn: sqlite3.Connection) -> None:
+# Special SQLite path for an ephemeral database.
+MEMORY_DB_PATH = ":memory:"
+# ':memory:' is opened through this URI so every connection in the process sees the same database.
+_SHARED_MEMORY_URI = "file::memory:?cache=shared"
+
+
+def _configure_connection(conn: sqlite3.Connection, db_path: str) -> None:
     """Configure SQLite connection pragmas and row factory."""
-    conn.row_factory = sqlite3.Row
+    # Plain tuples: queries select explicit columns and unpack them positionally.
+    conn.row_factory = None
     conn.execute("PRAGMA foreign_keys = ON;")
-    # Performance pragmas for demo purposes; adjust if needed.
+    # Wait for a competing writer instead of failing immediately with SQLITE_BUSY.
+    conn.execute("PRAGMA busy_timeout = 5000;")
+    # ~20 MB page cache (negative values are KiB) and in-memory temp tables/indices.
+    conn.execute("PRAGMA cache_size = -20000;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
+    if db_path == MEMORY_DB_PATH:
+        # WAL does not apply to in-memory databases.
+        return
     conn.execute("PRAGMA journal_mode = WAL;")
+    # NORMAL is durable against application crashes under WAL and skips the fsync per commit.
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA wal_autocheckpoint = 1000;")
 
 
 # PUBLIC_INTERFACE
 def open_connection(db_path: str) -> sqlite3.Connection:
     """Open a sqlite3 connection with sane defaults and return it."""
-    # Using check_same_thread=False allows use across async contexts;
-    # we still create/close per-request via dependencies.
-    conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES, check_same_thread=False)
-    _configure_connection(conn)
+    # Using check_same_thread=False allows use across async contexts; pooled
+    # connections are handed to one request at a time, never shared concurrently.
+    # A larger statement cache keeps every repository query prepared for the life of a pooled connection.
+    is_memory = db_path == MEMORY_DB_PATH
+    conn = sqlite3.connect(
+        _SHARED_MEMORY_URI if is_memory else db_path,
+        check_same_thread=False,
+        cached_statements=256,
+        uri=is_memory,
+    )
+    _configure_connection(conn, db_path)
     return conn
 
 
+# The single connection backing ':memory:' mode, opened lazily and kept for the process lifetime.
+# A plain Lock (not RLock) serializes its use: FastAPI may enter and exit a dependency on
+# different threadpool threads, and only a Lock can be released by another thread.
+_memory_conn: Optional[sqlite3.Connection] = None
+_memory_lock = threading.Lock()
+# Async gate in front of _memory_lock for request handlers: one request at a time is
+# admitted, so the blocking lock is never contended on a threadpool thread.
+_memory_limiter = anyio.CapacityLimiter(1)
+
+
+def _get_memory_connection() -> sqlite3.Connection:
+    """Return the shared in-memory connection, opening it on first use. Caller holds _memory_lock."""
+    global _memory_conn
+    if _memory_conn is None:
+        _memory_conn = open_connection(MEMORY_DB_PATH)
+    return _memory_conn
+
+
+def _default_pool_size() -> int:
+    """Size pools to the number of CPU cores, falling back to a small constant."""
+    return os.cpu_count() or 4
+
+
+class ConnectionPool:
+    """Thread-safe pool of configured SQLite connections for a single database file.
+
+    Connections are opened lazily up to `size` and then reused, so the file open
+    and PRAGMA setup cost is paid once per connection instead of once per request.
+    Read-only pools set `query_only` so their connections can never take the write lock.
+
+    `acquire` blocks its thread while the pool is exhausted. Async callers should first
+    take a token from `limiter` (sized to the pool), so they wait on the event loop
+    instead of parking threadpool threads that running requests still need.
+    """
+
+    def __init__(self, db_path: str, size: int, readonly: bool = False) -> None:
+        self.db_path = db_path
+        self.size = size
+        self.readonly = readonly
+        self._idle: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=size)
+        self._opened = 0
+        self._lock = threading.Lock()
+        self.limiter = anyio.CapacityLimiter(size)
+
+    def _open(self) -> Optional[sqlite3.Connection]:
+        """Open a new connection if the pool is below its size, else return None."""
+        with self._lock:
+            if self._opened >= self.size:
+                return None
+            self._opened += 1
+        try:
+            conn = open_connection(self.db_path)
+            if self.readonly:
+                conn.execute("PRAGMA query_only = ON;")
+            return conn
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """Close a connection that can no longer be reused and free its slot."""
+        try:
+            conn.close()
+        finally:
+            with self._lock:
+                self._opened -= 1
+
+    # PUBLIC_INTERFACE
+    def prewarm(self, count: Optional[int] = None) -> None:
+        """Open and configure up to `count` connections (default: the pool size) ahead of use."""
+        for _ in range(self.size if count is None else min(count, self.size)):
+            conn = self._open()
+            if conn is None:
+                return
+            self._idle.put_nowait(conn)
+
+    # PUBLIC_INTERFACE
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection, blocking until one is free if the pool is exhausted."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        conn = self._open()
+        if conn is None:
+            conn = self._idle.get()
+        return conn
+
+    # PUBLIC_INTERFACE
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool, rolling back any transaction left open."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+        self._idle.put_nowait(conn)
+
+    # PUBLIC_INTERFACE
+    def close(self) -> None:
+        """Close all idle connections held by the pool."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(conn)
+
+
+_pools: Dict[Tuple[str, bool], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
 # PUBLIC_INTERFACE
-def init_db(db_path: str) -> None:
-    """Initialize the SQLite database schema if it does not already exist."""
-    conn = open_connection(db_path)
+def get_pool(db_path: str, readonly: bool = False) -> ConnectionPool:
+    """Return the process-wide reader or writer pool for db_path, creating it on first use.
+
+    Reader pools hold one connection per CPU core; the writer pool holds a single
+    connection, since SQLite in WAL mode admits only one writer at a time anyway.
+    """
+    key = (db_path, readonly)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                size = _default_pool_size() if readonly else 1
+                pool = _pools[key] = ConnectionPool(db_path, size, readonly=readonly)
+    return pool
+
+
+# PUBLIC_INTERFACE
+def connection_limiter(db_path: str, readonly: bool) -> anyio.CapacityLimiter:
+    """Return the async admission gate for db_path's reader or writer connections.
+
+    Holding a token guarantees the matching acquire_reader/acquire_writer will not block.
+    ':memory:' readers and writers share one gate, as they share one connection.
+    """
+    if db_path == MEMORY_DB_PATH:
+        return _memory_limiter
+    return get_pool(db_path, readonly=readonly).limiter
+
+
+# PUBLIC_INTERFACE
+def prewarm_pools(db_path: str) -> None:
+    """Open all reader and writer connections for db_path so the first requests skip connect cost."""
+    if db_path == MEMORY_DB_PATH:
+        return
+    get_pool(db_path, readonly=False).prewarm()
+    get_pool(db_path, readonly=True).prewarm()
+
+
+# PUBLIC_INTERFACE
+def close_pools() -> None:
+    """Close idle pooled connections and the shared in-memory connection (used on application shutdown)."""
+    global _memory_conn, _memory_limiter
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+    with _memory_lock:
+        if _memory_conn is not None:
+            _memory_conn.close()
+            _memory_conn = None
+        # A fresh gate for the next application startup, which may run on another event loop.
+        _memory_limiter = anyio.CapacityLimiter(1)
+
+
+@contextmanager
+def _pooled_connection(db_path: str, readonly: bool) -> Iterator[sqlite3.Connection]:
+    """Yield a pooled connection for db_path and return it to the pool afterwards.
+
+    ':memory:' is not pooled: every caller gets the one shared connection, one at a time.
+    """
+    if db_path == MEMORY_DB_PATH:
+        with _memory_lock:
+            conn = _get_memory_connection()
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+        return
+
+    pool = get_pool(db_path, readonly=readonly)
+    conn = pool.acquire()
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
+
+
+# PUBLIC_INTERFACE
+def acquire_reader(db_path: str) -> ContextManager[sqlite3.Connection]:
+    """Check out a read-only (query_only) connection for db_path."""
+    return _pooled_connection(db_path, readonly=True)
+
+
+# PUBLIC_INTERFACE
+def acquire_writer(db_path: str) -> ContextManager[sqlite3.Connection]:
+    """Check out the single writer connection for db_path."""
+    return _pooled_connection(db_path, readonly=False)
+
+
+# Timestamps are stored as INTEGER milliseconds since the Unix epoch (UTC).
+_NOTES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        content TEXT,
+        created_at INTEGER NOT NULL,
+        updated_at INTEGER NOT NULL
+    );
+"""
+
+# Converts a legacy ISO 8601 TEXT timestamp column to epoch milliseconds.
+_ISO_TO_EPOCH_MS_SQL = "CAST(ROUND((julianday({column}) - 2440587.5) * 86400000) AS INTEGER)"
+
+
+def _migrate_text_timestamps(conn: sqlite3.Connection) -> None:
+    """Rebuild a notes table created with TEXT timestamps so they are stored as epoch milliseconds.
+
+    The column check runs under the write lock, so when several workers start at once only
+    the first migrates and the others see the INTEGER columns and leave the table alone.
+    """
+    conn.execute("BEGIN IMMEDIATE")
     try:
+        column_types = {row[1]: row[2].upper() for row in conn.execute("PRAGMA table_info(notes);")}
+        if column_types.get("updated_at") != "TEXT":
+            conn.commit()
+            return
+
+        seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'notes';").fetchone()
+        conn.execute(_NOTES_TABLE_SQL.format(table="notes_migrated"))
         conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS notes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                content TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            );
-            """
+            "INSERT INTO notes_migrated (id, title, content, created_at, updated_at) "
+            f"SELECT id, title, content, {_ISO_TO_EPOCH_MS_SQL.format(column='created_at')}, "
+            f"{_ISO_TO_EPOCH_MS_SQL.format(column='updated_at')} FROM notes;"
         )
+        conn.execute("DROP TABLE notes;")
+        conn.execute("ALTER TABLE notes_migrated RENAME TO notes;")
+        if seq is not None:
+            # Keep AUTOINCREMENT from reusing IDs of notes deleted before the migration.
+            conn.execute("UPDATE sqlite_sequence SET seq = max(seq, ?) WHERE name = 'notes';", (seq[0],))
         conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+# PUBLIC_INTERFACE
+def init_db(db_path: str) -> None:
+    """Initialize the SQLite database schema if it does not already exist."""
+    if db_path == MEMORY_DB_PATH:
+        with _memory_lock:
+            _create_schema(_get_memory_connection())
+        return
+
+    conn = open_connection(db_path)
+    try:
+        _create_schema(conn)
     finally:
         conn.close()
 
 
+def _create_schema(conn: sqlite3.Connection) -> None:
+    """Create (or migrate) the notes table and its indexes on conn."""
+    _migrate_text_timestamps(conn)
+    conn.execute(_NOTES_TABLE_SQL.format(table="notes"))
+    # Covering index for list_notes: it matches the list ordering and carries every
+    # column, so paging reads index pages only and never visits the table rows.
+    # Tradeoff: content is stored twice, roughly doubling on-disk size and write cost
+    # for large notes. If notes grow big, fall back to the narrow
+    # (updated_at DESC, id DESC) index and accept one row lookup per listed note.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notes_list ON notes (updated_at DESC, id DESC, title, content, created_at);"
+    )
+    # The narrow ordering index is a prefix of ix_notes_list and would only add write cost.
+    conn.execute("DROP INDEX IF EXISTS ix_notes_updated;")
+    conn.commit()
+
+
 def _execute_script(conn: sqlite3.Connection, sql: str, params: Optional[Iterable] = None) -> sqlite3.Cursor:
     """Helper for executing SQL with parameters."""
     cur = conn.cursor()
@@ -1,10 +1,12 @@
-from typing import List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import get_settings
-from .db import init_db
+from .db import close_pools, init_db, prewarm_pools
+from .repository import clear_note_cache
 from .routes.notes import router as notes_router
 
 # Initialize settings
@@ -18,12 +20,29 @@ openapi_tags_metadata: List[dict] = [
     }
 ]
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Initialize the database schema and warm connection pools before serving; close them on shutdown.
+
+    The note cache is cleared on both sides: it is keyed by note ID only, so it must
+    not outlive the database (e.g. a ':memory:' one) or carry over to another path.
+    """
+    clear_note_cache()
+    init_db(settings.notes_db_path)
+    prewarm_pools(settings.notes_db_path)
+    yield
+    close_pools()
+    clear_note_cache()
+
+
 # Create FastAPI application with metadata for docs
 app = FastAPI(
     title=settings.app_title,
     description=settings.app_description,
     version=settings.app_version,
     openapi_tags=openapi_tags_metadata,
+    lifespan=lifespan,
 )
 
 # CORS configuration
@@ -37,12 +56,6 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
-def on_startup() -> None:
-    """Initialize database schema on app startup."""
-    init_db(settings.notes_db_path)
-
-
 # Health check endpoint
 # PUBLIC_INTERFACE
 @app.get(
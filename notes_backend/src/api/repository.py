@@ -1,25 +1,163 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from .models import NoteOut
 
+_UTC = timezone.utc
 
-def _now_iso() -> str:
-    """Return current UTC time as ISO 8601 string."""
-    return datetime.now(timezone.utc).isoformat()
+# SQLite 3.35+ supports RETURNING, letting a write hand back the row without a follow-up SELECT.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
+_NOTE_COLUMNS = "id, title, content, created_at, updated_at"
 
-def _row_to_note_dict(row: sqlite3.Row) -> Dict[str, Any]:
-    """Convert a sqlite Row to a dict suitable for NoteOut."""
+# SQL is kept in module-level constants so every call reuses the same text and
+# hits the connection's prepared statement cache instead of recompiling.
+_SQL_BEGIN_WRITE = "BEGIN IMMEDIATE"
+_SQL_INSERT = "INSERT INTO notes (title, content, created_at, updated_at) VALUES (?, ?, ?, ?)"
+_SQL_INSERT_RETURNING = f"{_SQL_INSERT} RETURNING {_NOTE_COLUMNS}"
+_SQL_SELECT_BY_ID = f"SELECT {_NOTE_COLUMNS} FROM notes WHERE id = ?"
+_SQL_LIST = f"SELECT {_NOTE_COLUMNS} FROM notes ORDER BY updated_at DESC, id DESC LIMIT ? OFFSET ?"
+_SQL_DELETE = "DELETE FROM notes WHERE id = ?"
+
+# UPDATE statements keyed by (title given, content given), so update_note never builds SQL per call.
+_SQL_UPD_T = "UPDATE notes SET title = ?, updated_at = ? WHERE id = ?"
+_SQL_UPD_C = "UPDATE notes SET content = ?, updated_at = ? WHERE id = ?"
+_SQL_UPD_TC = "UPDATE notes SET title = ?, content = ?, updated_at = ? WHERE id = ?"
+_SQL_UPD_TOUCH = "UPDATE notes SET updated_at = ? WHERE id = ?"
+_SQL_UPDATE: Dict[Tuple[bool, bool], str] = {
+    (True, False): _SQL_UPD_T,
+    (False, True): _SQL_UPD_C,
+    (True, True): _SQL_UPD_TC,
+    (False, False): _SQL_UPD_TOUCH,
+}
+_SQL_UPDATE_RETURNING: Dict[Tuple[bool, bool], str] = {
+    key: f"{sql} RETURNING {_NOTE_COLUMNS}" for key, sql in _SQL_UPDATE.items()
+}
+
+
+class _NoteCache:
+    """Thread-safe LRU of notes by ID, invalidated per key after each committed write.
+
+    A generation counter, bumped on every invalidation, stops a read that started
+    before a write from re-caching the stale row afterwards. Invalidation only sees
+    writes made through this process, so entries also expire after `ttl` seconds;
+    that bounds how stale a read can be when other workers or tools write the database.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._notes: "OrderedDict[int, Tuple[NoteOut, float]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, note_id: int) -> Optional[NoteOut]:
+        with self._lock:
+            entry = self._notes.get(note_id)
+            if entry is None:
+                return None
+            note, expires_at = entry
+            if self._clock() >= expires_at:
+                del self._notes[note_id]
+                return None
+            self._notes.move_to_end(note_id)
+            return note
+
+    def put(self, note: NoteOut, generation: int) -> None:
+        """Cache a note read at `generation`, unless a write has happened since."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._notes[note.id] = (note, self._clock() + self._ttl)
+            self._notes.move_to_end(note.id)
+            if len(self._notes) > self._maxsize:
+                self._notes.popitem(last=False)
+
+    def invalidate(self, note_id: int) -> None:
+        with self._lock:
+            self._generation += 1
+            self._notes.pop(note_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._notes.clear()
+
+
+# Short TTL: hot notes still skip SQLite on repeat reads, while writes from other
+# processes become visible within a few seconds.
+_NOTE_CACHE_TTL_SECONDS = 5.0
+
+_note_cache = _NoteCache(maxsize=1024, ttl=_NOTE_CACHE_TTL_SECONDS)
+
+
+# PUBLIC_INTERFACE
+def clear_note_cache() -> None:
+    """Drop every cached note, e.g. when the application switches or closes its database."""
+    _note_cache.clear()
+
+# Note IDs changed by each connection's open write transaction, evicted from the
+# cache only once that transaction commits.
+_uncommitted_changes: Dict[sqlite3.Connection, Set[int]] = {}
+
+
+def _mark_changed(conn: sqlite3.Connection, note_id: int) -> None:
+    """Record that the open transaction on conn changed note_id."""
+    _uncommitted_changes.setdefault(conn, set()).add(note_id)
+
+
+# PUBLIC_INTERFACE
+@contextmanager
+def write_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run repository writes in one BEGIN IMMEDIATE transaction.
+
+    Commits when the block exits cleanly and rolls back if it raises, so callers
+    decide how many writes share a single commit.
+    """
+    conn.execute(_SQL_BEGIN_WRITE)
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        _uncommitted_changes.pop(conn, None)
+        conn.rollback()
+        raise
+    for note_id in _uncommitted_changes.pop(conn, ()):
+        _note_cache.invalidate(note_id)
+
+
+def _now_ms() -> int:
+    """Return current UTC time as milliseconds since the Unix epoch (no datetime or formatting)."""
+    return time.time_ns() // 1_000_000
+
+
+def _ms_to_datetime(ms: int) -> datetime:
+    """Convert stored epoch milliseconds to a UTC datetime."""
+    # Positional tz with a module-level constant avoids the keyword and attribute lookups.
+    return datetime.fromtimestamp(ms / 1000, _UTC)
+
+
+def _row_to_note_dict(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Convert a row selected as _NOTE_COLUMNS to a dict suitable for NoteOut.model_construct."""
+    note_id, title, content, created_at, updated_at = row
     return {
-        "id": row["id"],
-        "title": row["title"],
-        "content": row["content"],
-        "created_at": row["created_at"],
-        "updated_at": row["updated_at"],
+        "id": note_id,
+        "title": title,
+        "content": content,
+        "created_at": _ms_to_datetime(created_at),
+        "updated_at": _ms_to_datetime(updated_at),
     }
 
 
@@ -33,72 +171,98 @@ def _fetch_one(conn: sqlite3.Connection, sql: str, params: Tuple[Any, ...]) -> O
 
 # PUBLIC_INTERFACE
 def create_note(conn: sqlite3.Connection, title: str, content: Optional[str]) -> NoteOut:
-    """Create a new note and return it."""
-    now = _now_iso()
-    cur = conn.execute(
-        "INSERT INTO notes (title, content, created_at, updated_at) VALUES (?, ?, ?, ?)",
-        (title, content, now, now),
-    )
-    note_id = cur.lastrowid
-    conn.commit()
-    created = _fetch_one(conn, "SELECT * FROM notes WHERE id = ?", (note_id,))
+    """Create a new note and return it. Must run inside write_transaction."""
+    now = _now_ms()
+    if _HAS_RETURNING:
+        created = _fetch_one(conn, _SQL_INSERT_RETURNING, (title, content, now, now))
+    else:
+        cur = conn.execute(_SQL_INSERT, (title, content, now, now))
+        note_id = cur.lastrowid
+        created = _fetch_one(conn, _SQL_SELECT_BY_ID, (note_id,))
     assert created is not None  # Newly inserted row must exist
-    return NoteOut.model_validate(created)
+    # Rows come from our own schema, so skip re-validating them.
+    return NoteOut.model_construct(**created)
 
 
 # PUBLIC_INTERFACE
 def get_note(conn: sqlite3.Connection, note_id: int) -> Optional[NoteOut]:
-    """Fetch a single note by ID."""
-    row_dict = _fetch_one(conn, "SELECT * FROM notes WHERE id = ?", (note_id,))
-    return NoteOut.model_validate(row_dict) if row_dict else None
+    """Fetch a single note by ID, serving repeat reads from an in-process LRU cache."""
+    note = _note_cache.get(note_id)
+    if note is not None:
+        return note
+    generation = _note_cache.generation
+    row_dict = _fetch_one(conn, _SQL_SELECT_BY_ID, (note_id,))
+    if not row_dict:
+        return None
+    note = NoteOut.model_construct(**row_dict)
+    _note_cache.put(note, generation)
+    return note
 
 
 # PUBLIC_INTERFACE
-def list_notes(conn: sqlite3.Connection, offset: int = 0, limit: int = 100) -> List[NoteOut]:
-    """List notes ordered by updated_at descending, with pagination."""
-    cur = conn.execute(
-        "SELECT * FROM notes ORDER BY datetime(updated_at) DESC, id DESC LIMIT ? OFFSET ?",
-        (limit, offset),
-    )
-    rows = cur.fetchall()
-    return [NoteOut.model_validate(_row_to_note_dict(r)) for r in rows]
+def list_notes(conn: sqlite3.Connection, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+    """List notes ordered by updated_at descending, with pagination.
+
+    Returns plain dicts shaped like NoteOut, ready to be serialized directly.
+    """
+    cur = conn.execute(_SQL_LIST, (limit, offset))
+    to_datetime = _ms_to_datetime
+    return [
+        {
+            "id": note_id,
+            "title": title,
+            "content": content,
+            "created_at": to_datetime(created_at),
+            "updated_at": to_datetime(updated_at),
+        }
+        for note_id, title, content, created_at, updated_at in cur.fetchall()
+    ]
 
 
 # PUBLIC_INTERFACE
 def update_note(
     conn: sqlite3.Connection, note_id: int, title: Optional[str] = None, content: Optional[str] = None
 ) -> Optional[NoteOut]:
-    """Update a note's title/content and return the updated note if it exists."""
-    exists = _fetch_one(conn, "SELECT id FROM notes WHERE id = ?", (note_id,))
-    if not exists:
-        return None
+    """Update a note's title/content and return the updated note if it exists.
 
-    fields = []
-    params: List[Any] = []
+    Must run inside write_transaction.
+    """
+    key = (title is not None, content is not None)
+    now = _now_ms()
+    params: Tuple[Any, ...]
+    if key == (True, True):
+        params = (title, content, now, note_id)
+    elif key[0]:
+        params = (title, now, note_id)
+    elif key[1]:
+        params = (content, now, note_id)
+    else:
+        params = (now, note_id)
 
-    if title is not None:
-        fields.append("title = ?")
-        params.append(title)
-    if content is not None:
-        fields.append("content = ?")
-        params.append(content)
+    if _HAS_RETURNING:
+        # A missing note simply returns no row, so no existence check is needed.
+        updated = _fetch_one(conn, _SQL_UPDATE_RETURNING[key], params)
+        if updated:
+            _mark_changed(conn, note_id)
+        return NoteOut.model_construct(**updated) if updated else None
 
-    fields.append("updated_at = ?")
-    params.append(_now_iso())
-
-    params.append(note_id)
-
-    sql = f"UPDATE notes SET {', '.join(fields)} WHERE id = ?"
-    conn.execute(sql, tuple(params))
-    conn.commit()
+    cur = conn.execute(_SQL_UPDATE[key], params)
+    if cur.rowcount == 0:
+        return None
+    _mark_changed(conn, note_id)
 
-    updated = _fetch_one(conn, "SELECT * FROM notes WHERE id = ?", (note_id,))
-    return NoteOut.model_validate(updated) if updated else None
+    updated = _fetch_one(conn, _SQL_SELECT_BY_ID, (note_id,))
+    return NoteOut.model_construct(**updated) if updated else None
 
 
 # PUBLIC_INTERFACE
 def delete_note(conn: sqlite3.Connection, note_id: int) -> bool:
-    """Delete a note by ID. Returns True if the note existed and was deleted."""
-    cur = conn.execute("DELETE FROM notes WHERE id = ?", (note_id,))
-    conn.commit()
-    return cur.rowcount > 0
+    """Delete a note by ID. Returns True if the note existed and was deleted.
+
+    Must run inside write_transaction.
+    """
+    cur = conn.execute(_SQL_DELETE, (note_id,))
+    if cur.rowcount == 0:
+        return False
+    _mark_changed(conn, note_id)
+    return True
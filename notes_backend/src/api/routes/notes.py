@@ -1,22 +1,66 @@
-from typing import List
+import sqlite3
+from contextlib import contextmanager
+from typing import Any, Iterator, List
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
+from fastapi.concurrency import contextmanager_in_threadpool
+from fastapi.responses import ORJSONResponse
 
-from ..config import get_settings, Settings
-from ..db import open_connection
+from ..config import get_settings
+from ..db import acquire_reader, acquire_writer, connection_limiter
 from ..models import NoteCreate, NoteOut, NoteUpdate
-from ..repository import create_note, delete_note, get_note, list_notes, update_note
+from ..repository import create_note, delete_note, get_note, list_notes, update_note, write_transaction
 
 router = APIRouter(prefix="/notes", tags=["Notes"])
 
 
-def _get_db_conn(settings: Settings = Depends(get_settings)):
-    """Dependency to open and yield a DB connection per-request, ensuring clean close."""
-    conn = open_connection(settings.notes_db_path)
-    try:
+class _NotesJSONResponse(ORJSONResponse):
+    """orjson response emitting UTC datetimes with a 'Z' suffix, matching NoteOut's JSON output."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+
+
+def _note_response(note: NoteOut, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize a trusted NoteOut straight to JSON with pydantic-core.
+
+    Returning a Response skips FastAPI's response_model round-trip (dump, re-validate,
+    jsonable_encoder, json.dumps); response_model stays on the routes for the OpenAPI schema.
+    """
+    return Response(content=note.model_dump_json(), status_code=status_code, media_type="application/json")
+
+
+async def _get_db_ro():
+    """Dependency to yield a pooled read-only DB connection per-request.
+
+    Waiting for a free connection happens on the event loop via the pool's limiter, so
+    a burst of requests cannot park every threadpool thread while the requests that
+    hold connections still need a thread to run their endpoints.
+    """
+    db_path = get_settings().notes_db_path
+    async with connection_limiter(db_path, readonly=True):
+        async with contextmanager_in_threadpool(acquire_reader(db_path)) as conn:
+            yield conn
+
+
+@contextmanager
+def _write_session(db_path: str) -> Iterator[sqlite3.Connection]:
+    """Check out the writer connection and run the block in one write transaction."""
+    with acquire_writer(db_path) as conn, write_transaction(conn):
         yield conn
-    finally:
-        conn.close()
+
+
+async def _get_db_rw():
+    """Dependency to yield the pooled writer DB connection inside a per-request write transaction.
+
+    The transaction commits after the endpoint returns and rolls back if it raises. As with
+    _get_db_ro, queued writers wait on the event loop rather than on threadpool threads.
+    """
+    db_path = get_settings().notes_db_path
+    async with connection_limiter(db_path, readonly=False):
+        async with contextmanager_in_threadpool(_write_session(db_path)) as conn:
+            yield conn
 
 
 # PUBLIC_INTERFACE
@@ -33,11 +77,11 @@ def _get_db_conn(settings: Settings = Depends(get_settings)):
 )
 def create_note_endpoint(
     payload: NoteCreate,
-    settings: Settings = Depends(get_settings),
-    conn=Depends(_get_db_conn),
-) -> NoteOut:
+    conn=Depends(_get_db_rw),
+) -> Response:
     """Create a note."""
-    return create_note(conn, title=payload.title, content=payload.content)
+    note = create_note(conn, title=payload.title, content=payload.content)
+    return _note_response(note, status_code=status.HTTP_201_CREATED)
 
 
 # PUBLIC_INTERFACE
@@ -50,11 +94,12 @@ def create_note_endpoint(
 def list_notes_endpoint(
     offset: int = Query(0, ge=0, description="Number of items to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum number of items to return"),
-    settings: Settings = Depends(get_settings),
-    conn=Depends(_get_db_conn),
-) -> List[NoteOut]:
+    conn=Depends(_get_db_ro),
+) -> _NotesJSONResponse:
     """List notes with pagination."""
-    return list_notes(conn, offset=offset, limit=limit)
+    # Rows are trusted, so serialize them directly with orjson; returning a Response
+    # bypasses response_model validation, which is kept only to document the schema.
+    return _NotesJSONResponse(list_notes(conn, offset=offset, limit=limit))
 
 
 # PUBLIC_INTERFACE
@@ -67,14 +112,13 @@ def list_notes_endpoint(
 )
 def get_note_endpoint(
     note_id: int = Path(..., ge=1, description="ID of the note to fetch"),
-    settings: Settings = Depends(get_settings),
-    conn=Depends(_get_db_conn),
-) -> NoteOut:
+    conn=Depends(_get_db_ro),
+) -> Response:
     """Fetch a note by ID."""
     note = get_note(conn, note_id=note_id)
     if not note:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
-    return note
+    return _note_response(note)
 
 
 # PUBLIC_INTERFACE
@@ -88,14 +132,13 @@ def get_note_endpoint(
 def update_note_endpoint(
     payload: NoteUpdate,
     note_id: int = Path(..., ge=1, description="ID of the note to update"),
-    settings: Settings = Depends(get_settings),
-    conn=Depends(_get_db_conn),
-) -> NoteOut:
+    conn=Depends(_get_db_rw),
+) -> Response:
     """Update a note by ID."""
     updated = update_note(conn, note_id=note_id, title=payload.title, content=payload.content)
     if not updated:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
-    return updated
+    return _note_response(updated)
 
 
 # PUBLIC_INTERFACE
@@ -108,8 +151,7 @@ def update_note_endpoint(
 )
 def delete_note_endpoint(
     note_id: int = Path(..., ge=1, description="ID of the note to delete"),
-    settings: Settings = Depends(get_settings),
-    conn=Depends(_get_db_conn),
+    conn=Depends(_get_db_rw),
 ) -> Response:
     """Delete a note by ID."""
     deleted = delete_note(conn, note_id=note_id)
@@ -0,0 +1,25 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import main
+from src.api.config import get_settings
+
+
+@pytest.fixture
+def make_client(monkeypatch, tmp_path):
+    """Return a factory building a TestClient against a fresh database at db_path."""
+
+    def _make(db_path=None):
+        monkeypatch.setenv("NOTES_DB_PATH", db_path or str(tmp_path / "notes.db"))
+        get_settings.cache_clear()
+        monkeypatch.setattr(main, "settings", get_settings())
+        return TestClient(main.app)
+
+    yield _make
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def client(make_client):
+    with make_client() as test_client:
+        yield test_client
@@ -0,0 +1,90 @@
+from datetime import datetime
+
+
+def test_note_cache_does_not_outlive_memory_database(make_client):
+    with make_client(":memory:") as client:
+        note_id = client.post("/notes", json={"title": "first session"}).json()["id"]
+        assert client.get(f"/notes/{note_id}").status_code == 200
+
+    # Shutdown dropped the in-memory database; a new session starts empty.
+    with make_client(":memory:") as client:
+        assert client.get("/notes").json() == []
+        assert client.get(f"/notes/{note_id}").status_code == 404
+
+
+def test_note_cache_does_not_carry_over_to_another_database(make_client, tmp_path):
+    with make_client(str(tmp_path / "a.db")) as client:
+        note_id = client.post("/notes", json={"title": "only in a"}).json()["id"]
+        assert client.get(f"/notes/{note_id}").status_code == 200
+
+    with make_client(str(tmp_path / "b.db")) as client:
+        assert client.get(f"/notes/{note_id}").status_code == 404
+
+
+NOTE_FIELDS = {"id", "title", "content", "created_at", "updated_at"}
+
+
+def _assert_note_shape(body):
+    assert set(body) == NOTE_FIELDS
+    for field in ("created_at", "updated_at"):
+        # Same encoding as Pydantic's default for UTC datetimes.
+        assert body[field].endswith("Z")
+        datetime.fromisoformat(body[field].replace("Z", "+00:00"))
+
+
+def test_note_crud_endpoints(client):
+    created = client.post("/notes", json={"title": "groceries", "content": "milk"})
+    assert created.status_code == 201
+    note = created.json()
+    _assert_note_shape(note)
+    assert (note["title"], note["content"]) == ("groceries", "milk")
+    assert note["created_at"] == note["updated_at"]
+
+    fetched = client.get(f"/notes/{note['id']}")
+    assert fetched.status_code == 200
+    assert fetched.json() == note
+
+    updated = client.put(f"/notes/{note['id']}", json={"content": "oat milk"})
+    assert updated.status_code == 200
+    _assert_note_shape(updated.json())
+    assert updated.json()["title"] == "groceries"
+    assert updated.json()["content"] == "oat milk"
+    assert updated.json()["created_at"] == note["created_at"]
+
+    second = client.post("/notes", json={"title": "todo"}).json()
+    listed = client.get("/notes")
+    assert listed.status_code == 200
+    assert listed.headers["content-type"] == "application/json"
+    for item in listed.json():
+        _assert_note_shape(item)
+    # Ordered by last update; list items serialize exactly like the single-note endpoints.
+    assert listed.json() == [second, client.get(f"/notes/{note['id']}").json()]
+    assert listed.json()[1] == updated.json()
+
+    deleted = client.delete(f"/notes/{note['id']}")
+    assert deleted.status_code == 204
+    assert deleted.content == b""
+    assert client.get(f"/notes/{note['id']}").status_code == 404
+
+
+def test_missing_note_returns_404_and_rolls_back(client):
+    missing_update = client.put("/notes/999", json={"title": "nope"})
+    assert missing_update.status_code == 404
+    assert missing_update.json() == {"detail": "Note not found"}
+
+    missing_delete = client.delete("/notes/999")
+    assert missing_delete.status_code == 404
+    assert missing_delete.json() == {"detail": "Note not found"}
+
+    assert client.get("/notes/999").status_code == 404
+
+    # The 404s rolled back their write transactions, so the writer connection is reusable.
+    created = client.post("/notes", json={"title": "after 404s"})
+    assert created.status_code == 201
+    assert [n["title"] for n in client.get("/notes").json()] == ["after 404s"]
+
+
+def test_invalid_payloads_are_rejected(client):
+    assert client.post("/notes", json={"title": ""}).status_code == 422
+    note_id = client.post("/notes", json={"title": "x"}).json()["id"]
+    assert client.put(f"/notes/{note_id}", json={}).status_code == 422
@@ -0,0 +1,67 @@
+import threading
+
+# Well above both the pool sizes and anyio's default 40-thread limiter, so requests
+# waiting for a connection would exhaust the threadpool if waiting held a thread.
+CONCURRENCY = 100
+TIMEOUT_SECONDS = 30
+
+
+def _run_concurrently(request, count=CONCURRENCY):
+    """Run request(i) on `count` daemon threads and return the responses that finished in time."""
+    responses = [None] * count
+
+    def worker(i):
+        responses[i] = request(i)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(TIMEOUT_SECONDS)
+    return [r for r in responses if r is not None]
+
+
+def test_concurrent_reads_above_pool_size(client):
+    note_id = client.post("/notes", json={"title": "shared"}).json()["id"]
+
+    responses = _run_concurrently(lambda i: client.get(f"/notes/{note_id}"))
+
+    assert len(responses) == CONCURRENCY
+    assert all(r.status_code == 200 for r in responses)
+
+
+def test_concurrent_writes_above_writer_pool_size(client):
+    responses = _run_concurrently(lambda i: client.post("/notes", json={"title": f"note {i}"}))
+
+    assert len(responses) == CONCURRENCY
+    assert all(r.status_code == 201 for r in responses)
+    assert len(client.get("/notes", params={"limit": 500}).json()) == CONCURRENCY
+
+
+def test_reads_progress_while_writers_queue(client):
+    note_id = client.post("/notes", json={"title": "shared"}).json()["id"]
+
+    def request(i):
+        if i % 2:
+            return client.put(f"/notes/{note_id}", json={"content": f"v{i}"})
+        return client.get(f"/notes/{note_id}")
+
+    responses = _run_concurrently(request)
+
+    assert len(responses) == CONCURRENCY
+    assert all(r.status_code == 200 for r in responses)
+
+
+def test_concurrent_requests_on_memory_database(make_client):
+    with make_client(":memory:") as client:
+
+        def request(i):
+            if i % 2:
+                return client.post("/notes", json={"title": f"note {i}"})
+            return client.get("/notes")
+
+        responses = _run_concurrently(request)
+
+        assert len(responses) == CONCURRENCY
+        assert all(r.status_code in (200, 201) for r in responses)
+        assert len(client.get("/notes", params={"limit": 500}).json()) == CONCURRENCY // 2
@@ -0,0 +1,43 @@
+import pytest
+
+from src.api.config import Settings
+
+
+def _split_and_strip(raw):
+    """The original split/strip/filter parsing the single-pass scan must match."""
+    raw = (raw or "").strip()
+    if raw == "" or raw == "*":
+        return ["*"]
+    return [o.strip() for o in raw.split(",") if o.strip()]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "",
+        "   ",
+        None,
+        "*",
+        " * ",
+        "http://a.test",
+        "http://a.test,https://b.test",
+        " http://a.test , https://b.test ",
+        "http://a.test,,https://b.test",
+        "http://a.test, ,\t,https://b.test",
+        "http://a.test,",
+        "http://a.test,,,",
+        ",http://a.test",
+        "\thttp://a.test\t,\thttps://b.test\t",
+        " , , ",
+        ",",
+        "*,http://a.test",
+    ],
+)
+def test_parse_cors_allow_origins_matches_split_semantics(raw):
+    assert Settings._parse_cors_allow_origins(raw) == _split_and_strip(raw)
+
+
+def test_cors_allow_origins_parsed_once():
+    settings = Settings(cors_allow_origins="http://a.test, https://b.test")
+    assert settings.cors_allow_origins() == ["http://a.test", "https://b.test"]
+    assert settings.cors_allow_origins() is settings.cors_allow_origins()
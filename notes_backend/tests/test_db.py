@@ -0,0 +1,120 @@
+import sqlite3
+from datetime import datetime
+
+from src.api.db import _migrate_text_timestamps, init_db
+
+LEGACY_SCHEMA = """
+    CREATE TABLE notes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        content TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+"""
+
+LEGACY_ROWS = [
+    ("first", "a", "2024-05-01T12:34:56.123456+00:00", "2024-05-02T08:00:00+00:00"),
+    ("second", None, "2024-05-03T10:00:00.500000+00:00", "2024-05-03T10:00:00.500000+00:00"),
+    ("deleted", "c", "2024-05-04T00:00:00+00:00", "2024-05-04T00:00:00+00:00"),
+]
+
+
+def _epoch_ms(iso: str) -> int:
+    return round(datetime.fromisoformat(iso).timestamp() * 1000)
+
+
+def _create_legacy_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute(LEGACY_SCHEMA)
+    conn.executemany(
+        "INSERT INTO notes (title, content, created_at, updated_at) VALUES (?, ?, ?, ?)", LEGACY_ROWS
+    )
+    # Deleting the highest ID leaves sqlite_sequence ahead of max(id).
+    conn.execute("DELETE FROM notes WHERE id = 3")
+    conn.commit()
+    conn.close()
+
+
+def test_init_db_migrates_text_timestamps_to_epoch_ms(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    _create_legacy_db(path)
+
+    init_db(path)
+    init_db(path)  # Re-running on a migrated database is a no-op.
+
+    conn = sqlite3.connect(path)
+    try:
+        column_types = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(notes)")}
+        assert column_types["created_at"] == "INTEGER"
+        assert column_types["updated_at"] == "INTEGER"
+
+        rows = conn.execute("SELECT id, title, content, created_at, updated_at FROM notes ORDER BY id").fetchall()
+        assert rows == [
+            (1, "first", "a", _epoch_ms(LEGACY_ROWS[0][2]), _epoch_ms(LEGACY_ROWS[0][3])),
+            (2, "second", None, _epoch_ms(LEGACY_ROWS[1][2]), _epoch_ms(LEGACY_ROWS[1][3])),
+        ]
+
+        assert conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'notes'").fetchone() == (3,)
+        cur = conn.execute("INSERT INTO notes (title, created_at, updated_at) VALUES ('new', 0, 0)")
+        assert cur.lastrowid == 4
+    finally:
+        conn.close()
+
+
+class _MigrateFirstOnBegin:
+    """Connection proxy that lets another worker migrate just before this one takes the write lock."""
+
+    def __init__(self, conn, other_worker):
+        self._conn = conn
+        self._other_worker = other_worker
+
+    def execute(self, sql, *args):
+        if sql.startswith("BEGIN") and self._other_worker is not None:
+            other_worker, self._other_worker = self._other_worker, None
+            other_worker()
+        return self._conn.execute(sql, *args)
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+
+def test_concurrent_migrations_only_migrate_once(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    _create_legacy_db(path)
+
+    def other_worker():
+        conn = sqlite3.connect(path)
+        try:
+            _migrate_text_timestamps(conn)
+        finally:
+            conn.close()
+
+    conn = sqlite3.connect(path)
+    try:
+        _migrate_text_timestamps(_MigrateFirstOnBegin(conn, other_worker))
+        rows = conn.execute("SELECT id, created_at, updated_at FROM notes ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+    assert rows == [
+        (1, _epoch_ms(LEGACY_ROWS[0][2]), _epoch_ms(LEGACY_ROWS[0][3])),
+        (2, _epoch_ms(LEGACY_ROWS[1][2]), _epoch_ms(LEGACY_ROWS[1][3])),
+    ]
+
+
+def test_init_db_creates_list_index_on_fresh_database(tmp_path):
+    path = str(tmp_path / "fresh.db")
+
+    init_db(path)
+
+    conn = sqlite3.connect(path)
+    try:
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert "ix_notes_list" in indexes
+        assert conn.execute("SELECT count(*) FROM notes").fetchone() == (0,)
+    finally:
+        conn.close()
@@ -0,0 +1,199 @@
+import sqlite3
+
+import pytest
+
+from src.api import repository
+from src.api.db import acquire_reader, acquire_writer, close_pools, init_db
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(repository, "_note_cache", repository._NoteCache(maxsize=1024, ttl=5.0, clock=fake))
+    return fake
+
+
+@pytest.fixture
+def db_path(tmp_path, clock):
+    path = str(tmp_path / "notes.db")
+    init_db(path)
+    yield path
+    close_pools()
+
+
+def _create(db_path, title):
+    with acquire_writer(db_path) as conn, repository.write_transaction(conn):
+        return repository.create_note(conn, title=title, content=None).id
+
+
+def _get(db_path, note_id):
+    with acquire_reader(db_path) as conn:
+        return repository.get_note(conn, note_id)
+
+
+def test_update_evicts_cached_note(db_path):
+    note_id = _create(db_path, "before")
+    assert _get(db_path, note_id).title == "before"
+
+    with acquire_writer(db_path) as conn, repository.write_transaction(conn):
+        repository.update_note(conn, note_id, title="after")
+
+    assert _get(db_path, note_id).title == "after"
+
+
+def test_delete_evicts_cached_note(db_path):
+    note_id = _create(db_path, "doomed")
+    assert _get(db_path, note_id) is not None
+
+    with acquire_writer(db_path) as conn, repository.write_transaction(conn):
+        assert repository.delete_note(conn, note_id)
+
+    assert _get(db_path, note_id) is None
+
+
+def test_cache_keeps_committed_row_until_write_commits(db_path):
+    note_id = _create(db_path, "before")
+    assert _get(db_path, note_id).title == "before"
+
+    with acquire_writer(db_path) as conn, repository.write_transaction(conn):
+        repository.update_note(conn, note_id, title="after")
+        # Uncommitted: readers still see, and may cache, the committed row.
+        assert _get(db_path, note_id).title == "before"
+
+    assert _get(db_path, note_id).title == "after"
+
+
+def test_rolled_back_write_leaves_cache_intact(db_path):
+    note_id = _create(db_path, "kept")
+    cached = _get(db_path, note_id)
+
+    with pytest.raises(RuntimeError):
+        with acquire_writer(db_path) as conn, repository.write_transaction(conn):
+            repository.update_note(conn, note_id, title="discarded")
+            raise RuntimeError
+
+    assert _get(db_path, note_id) is cached
+
+
+def test_read_overlapping_write_does_not_cache_stale_row(db_path, monkeypatch):
+    note_id = _create(db_path, "before")
+    real_fetch_one = repository._fetch_one
+
+    def fetch_then_commit_write(conn, sql, params):
+        # The read sees the old row, then a write commits before the reader caches it.
+        row = real_fetch_one(conn, sql, params)
+        monkeypatch.setattr(repository, "_fetch_one", real_fetch_one)
+        with acquire_writer(db_path) as wconn, repository.write_transaction(wconn):
+            repository.update_note(wconn, note_id, title="after")
+        return row
+
+    monkeypatch.setattr(repository, "_fetch_one", fetch_then_commit_write)
+
+    assert _get(db_path, note_id).title == "before"
+    assert _get(db_path, note_id).title == "after"
+
+
+def test_cached_note_expires_after_ttl(db_path, clock):
+    note_id = _create(db_path, "before")
+    assert _get(db_path, note_id).title == "before"
+
+    # A write the cache cannot see, e.g. from another worker process.
+    with acquire_writer(db_path) as conn:
+        conn.execute("UPDATE notes SET title = 'outside' WHERE id = ?", (note_id,))
+        conn.commit()
+
+    clock.now = 4.9
+    assert _get(db_path, note_id).title == "before"
+    clock.now = 5.0
+    assert _get(db_path, note_id).title == "outside"
+
+
+@pytest.fixture(params=[True, False], ids=["returning", "pre-3.35-fallback"])
+def returning(request, monkeypatch):
+    monkeypatch.setattr(repository, "_HAS_RETURNING", request.param)
+    return request.param
+
+
+def test_create_and_update_with_and_without_returning(db_path, returning):
+    with acquire_writer(db_path) as conn, repository.write_transaction(conn):
+        created = repository.create_note(conn, title="title", content="body")
+    assert (created.title, created.content) == ("title", "body")
+    assert created.created_at == created.updated_at
+
+    with acquire_writer(db_path) as conn, repository.write_transaction(conn):
+        updated = repository.update_note(conn, created.id, title="renamed")
+    assert updated.id == created.id
+    assert (updated.title, updated.content) == ("renamed", "body")
+    assert updated.created_at == created.created_at
+
+    assert _get(db_path, created.id).title == "renamed"
+
+
+def test_update_missing_note_with_and_without_returning(db_path, returning):
+    with acquire_writer(db_path) as conn, repository.write_transaction(conn):
+        assert repository.update_note(conn, 999, title="nope") is None
+    assert _get(db_path, 999) is None
+
+
+@pytest.mark.parametrize(
+    "changes, expected",
+    [
+        ({"title": "new title"}, ("new title", "old body")),
+        ({"content": "new body"}, ("old title", "new body")),
+        ({"title": "new title", "content": "new body"}, ("new title", "new body")),
+    ],
+    ids=["title-only", "content-only", "both"],
+)
+def test_update_changes_only_given_columns(db_path, returning, changes, expected):
+    note_id = _create(db_path, "old title")
+    with acquire_writer(db_path) as conn, repository.write_transaction(conn):
+        conn.execute("UPDATE notes SET content = 'old body' WHERE id = ?", (note_id,))
+
+    with acquire_writer(db_path) as conn, repository.write_transaction(conn):
+        updated = repository.update_note(conn, note_id, **changes)
+    assert (updated.title, updated.content) == expected
+
+    with acquire_reader(db_path) as conn:
+        stored = conn.execute("SELECT title, content FROM notes WHERE id = ?", (note_id,)).fetchone()
+    assert stored == expected
+
+
+class _FailingCommit:
+    """Connection proxy whose commit fails, as on a disk I/O error."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def execute(self, *args):
+        return self._conn.execute(*args)
+
+    def commit(self):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    def rollback(self):
+        self._conn.rollback()
+
+
+def test_failed_commit_rolls_back_and_forgets_changes(db_path):
+    note_id = _create(db_path, "before")
+    cached = _get(db_path, note_id)
+
+    with acquire_writer(db_path) as conn:
+        failing = _FailingCommit(conn)
+        with pytest.raises(sqlite3.OperationalError):
+            with repository.write_transaction(failing):
+                repository.update_note(failing, note_id, title="after")
+        assert not conn.in_transaction
+        assert failing not in repository._uncommitted_changes
+
+    assert _get(db_path, note_id) is cached
+    with acquire_reader(db_path) as conn:
+        assert conn.execute("SELECT title FROM notes WHERE id = ?", (note_id,)).fetchone() == ("before",)